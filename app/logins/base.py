@@ -1,9 +1,31 @@
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+def _backoff(start: float = 0.05, mult: float = 1.3, cap: float = 0.4) -> Iterator[float]:
+    """
+    Endless geometric poll delays: 50ms, 65ms, 84ms, ... capped at 400ms. Early
+    ticks react quickly (the form is often there right after navigation); late
+    ticks send fewer WebDriver commands.
+    """
+    delay = start
+    while True:
+        yield delay
+        delay = min(delay * mult, cap)
 
 
 class BaseLoginProvider(ABC):
+    # Providers are stateless singletons: no per-instance __dict__ needed.
+    __slots__ = ()
+
     site_key: str  # e.g. "flippa"
 
     @abstractmethod
@@ -16,5 +38,381 @@ class BaseLoginProvider(ABC):
     ) -> List[Dict[str, Any]]:
         """
         Perform login on the target site and return driver.get_cookies().
+
+        Callers should build the driver with an "eager" page load strategy
+        (`options.page_load_strategy = "eager"` for Chrome, or the
+        `pageLoadStrategy` capability), so navigation returns at
+        DOMContentLoaded instead of waiting for every tracker and image.
         """
         raise NotImplementedError
+
+
+class FormLoginProvider(BaseLoginProvider):
+    """
+    Data-driven email/password login:
+    open LOGIN_URL -> find fields -> fill + submit -> wait until logged in.
+
+    Subclasses set `site_key` and `LOGIN_URL`, and override the selector lists
+    (ordered most specific first) or the hooks only where a site differs.
+    """
+
+    __slots__ = ()
+
+    LOGIN_URL: str
+
+    EMAIL_SELECTORS = (
+        "input[type='email']",
+        "input[name='email']",
+        "input[id*='email' i]",
+        "input[placeholder*='email' i]",
+    )
+    PASSWORD_SELECTORS = (
+        "input[type='password']",
+        "input[name='password']",
+        "input[id*='password' i]",
+    )
+    SUBMIT_SELECTORS = (
+        "button[type='submit']",
+        "input[type='submit']",
+        "button",  # last resort
+    )
+
+    FORM_TIMEOUT = 20  # seconds to wait for the email/password inputs
+    LOGIN_TIMEOUT = 30  # seconds to wait for the post-submit logged-in state
+    POLL_INTERVAL = 0.2  # seconds between WebDriverWait checks (Selenium's default is 0.5)
+
+    # Elements that only exist for a signed-in session. Lets the post-submit wait
+    # finish early on sites that keep the URL on /login after a successful login.
+    LOGGED_IN_SELECTORS = (
+        "a[href*='logout' i]",
+        "a[href*='signout' i]",
+        "form[action*='logout' i]",
+    )
+    LOGGED_IN_CSS = ", ".join(LOGGED_IN_SELECTORS)  # subclasses overriding the list re-join it
+
+    _JS_PAGE_STATE = """
+        return {
+            url: location.href,
+            title: document.title,
+            loggedInMarker: document.querySelector(arguments[0]) !== null,
+        };
+    """
+
+    # JS function expressions shared by the in-page scripts below (and by
+    # subclasses): "rendered and enabled", scroll-into-view that skips the
+    # forced layout + scroll when the element is already fully on screen, and
+    # set-value.
+    _JS_IS_VISIBLE = """(e) => {
+        const s = getComputedStyle(e);
+        const r = e.getBoundingClientRect();
+        return s.display !== 'none' && s.visibility !== 'hidden'
+            && r.width > 0 && r.height > 0 && !e.disabled;
+    }"""
+    _JS_SCROLL_INTO_VIEW = """(el) => {
+        const r = el.getBoundingClientRect();
+        if (r.top < 0 || r.left < 0 || r.bottom > innerHeight || r.right > innerWidth) {
+            el.scrollIntoView({block: 'center', inline: 'center'});
+        }
+    }"""
+    # Set an input's value through the native setter, so framework-controlled
+    # inputs (React etc.) see the change, and fire input/change. Returns whether
+    # the value stuck (some pages rewrite it, or only accept key events).
+    _JS_SET_VALUE = """(el, v) => {
+        el.focus();
+        Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set.call(el, v);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        return el.value === v;
+    }"""
+
+    # In-page scan: tries the selectors in arguments[1] in order and returns the
+    # first element under arguments[0] that is rendered and enabled. One
+    # execute_script replaces find_elements per selector plus
+    # is_displayed/is_enabled per candidate (one round-trip each).
+    _JS_FIRST_VISIBLE = """
+        const visible = """ + _JS_IS_VISIBLE + """;
+        const root = arguments[0] || document;
+        for (const sel of arguments[1]) {
+            for (const e of root.querySelectorAll(sel)) {
+                if (visible(e)) return e;
+            }
+        }
+        return null;
+    """
+    _JS_ALL_VISIBLE = """
+        const [root, lists] = arguments;
+        const found = [];
+        for (const sels of lists) {
+            const el = (function () {""" + _JS_FIRST_VISIBLE + """}).call(null, root, sels);
+            if (!el) return null;
+            found.push(el);
+        }
+        return found;
+    """
+    _JS_FILL = """
+        const setValue = """ + _JS_SET_VALUE + """;
+        return setValue(arguments[0], arguments[1]);
+    """
+
+    # Fill both fields and submit their form in one round-trip.
+    # Nothing is submitted unless both values stuck (pages that rewrite .value or
+    # only accept key events), so the caller falls back to typing. Submits by
+    # clicking the form's default button, like Enter would, so click handlers
+    # (AJAX logins) run and the submitter is sent; requestSubmit() only without one.
+    _JS_FILL_AND_SUBMIT = """
+        const [email, pass, username, password] = arguments;
+        const form = pass.form || email.form;
+        if (!form || typeof form.requestSubmit !== 'function') return false;
+        const setValue = """ + _JS_SET_VALUE + """;
+        // Fill both before checking either
+        const stuck = [[email, username], [pass, password]].map(([el, v]) => setValue(el, v));
+        if (!stuck.every(Boolean)) return false;
+        const button = form.querySelector("button[type='submit'], input[type='submit'], button:not([type])");
+        if (button) {
+            if (button.disabled) return false;
+            button.click();
+        } else {
+            form.requestSubmit();
+        }
+        return true;
+    """
+    _JS_CLICK_FIRST_VISIBLE = """
+        const el = (function () {""" + _JS_FIRST_VISIBLE + """}).apply(null, arguments);
+        if (el) el.click();
+        return !!el;
+    """
+
+    def login(
+        self,
+        driver: WebDriver,
+        username: str,
+        password: str,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        debug = bool(kwargs.get("debug", False))
+
+        self._open(driver, self.LOGIN_URL)
+
+        root = self._pre_form_hook(driver, debug)
+
+        # Both inputs are resolved together: one script per poll tick, one timeout
+        fields = self._wait_visible_in(
+            driver, root, [self.EMAIL_SELECTORS, self.PASSWORD_SELECTORS], timeout=self.FORM_TIMEOUT
+        )
+        if fields is None:
+            raise RuntimeError(self._dbg(f"{self.site_key.upper()}: login inputs not found", driver, debug))
+        email_el, pass_el = fields
+
+        # Fill + submit in one script; fall back to real typing if that isn't possible
+        if not self._js_fill_and_submit(driver, email_el, pass_el, username, password):
+            self._type_and_submit(driver, root, email_el, pass_el, username, password)
+
+        self._wait_logged_in(driver)
+        return driver.get_cookies()
+
+    # -------- hooks --------
+
+    def _pre_form_hook(self, driver: WebDriver, debug: bool) -> Optional[WebElement]:
+        """
+        Prepare the page for the form (e.g. switch tabs) and return the element to
+        search for inputs in, or None for the whole document.
+        """
+        return None
+
+    def _logged_in(self, page: Dict[str, Any]) -> bool:
+        # `page` is one _page_state() snapshot, taken once per poll tick.
+        return "/login" not in page["url"].lower() or page["loggedInMarker"]
+
+    def _wait_logged_in(self, driver: WebDriver) -> bool:
+        """
+        Wait until _logged_in holds. Errors raised by _logged_in (RuntimeError)
+        propagate; returns False if the wait just ran out.
+        """
+        try:
+            WebDriverWait(driver, self.LOGIN_TIMEOUT, poll_frequency=self.POLL_INTERVAL).until(
+                lambda d: (page := self._page_state(d)) is not None and self._logged_in(page)
+            )
+            return True
+        except RuntimeError:
+            raise
+        except Exception:
+            pass
+
+        # Not fatal; some sites stay on /login but still set cookies. Give a
+        # pending navigation up to 5s to settle, but stop as soon as the
+        # document has finished loading instead of always sleeping.
+        try:
+            WebDriverWait(driver, 5, poll_frequency=self.POLL_INTERVAL).until(
+                lambda d: "/login" not in (d.current_url or "").lower()
+                or d.execute_script("return document.readyState") == "complete"
+            )
+        except Exception:
+            pass
+        return False
+
+    # -------- helpers --------
+
+    def _js_fill_and_submit(
+        self,
+        driver: WebDriver,
+        email_el: WebElement,
+        pass_el: WebElement,
+        username: str,
+        password: str,
+    ) -> bool:
+        """
+        Fast path: set both values and submit via JS. Returns False if the caller
+        should fall back to typing and clicking.
+        """
+        try:
+            return bool(driver.execute_script(self._JS_FILL_AND_SUBMIT, email_el, pass_el, username, password))
+        except Exception:
+            return False
+
+    def _page_state(self, driver: WebDriver) -> Optional[Dict[str, Any]]:
+        """
+        URL, title and "logged-in marker present" in one round-trip, instead of
+        current_url + title + a find_element (and a NoSuchElementException) per
+        marker selector. None if the page can't be queried right now (mid-navigation).
+        """
+        try:
+            return driver.execute_script(self._JS_PAGE_STATE, self.LOGGED_IN_CSS)
+        except WebDriverException:
+            return None
+
+    def _open(self, driver: WebDriver, url: str) -> None:
+        # The login form is usually queryable long before the page's third-party
+        # resources finish. If the page load times out (typically on a slow
+        # tracker) but the DOM is already usable, stop loading and carry on; only
+        # navigate again if the document never got going. Any other navigation
+        # error (DNS, connection refused, ...) propagates: Chrome's error page is
+        # "complete" too, and would otherwise pass for a loaded login page.
+        try:
+            driver.get(url)
+            return
+        except TimeoutException:
+            pass
+        try:
+            state = driver.execute_script("return document.readyState")
+        except WebDriverException:
+            state = None
+        if state in ("interactive", "complete"):
+            driver.execute_script("window.stop();")
+            return
+        try:
+            driver.get(url)
+        except TimeoutException:
+            driver.execute_script("window.stop();")
+
+    def _type_and_submit(
+        self,
+        driver: WebDriver,
+        root: Optional[WebElement],
+        email_el: WebElement,
+        pass_el: WebElement,
+        username: str,
+        password: str,
+    ) -> None:
+        self._clear_and_type(driver, email_el, username)
+        self._clear_and_type(driver, pass_el, password)
+
+        # Submit (prefer Enter on password)
+        try:
+            pass_el.send_keys(Keys.ENTER)
+        except Exception:
+            # fallback: click a submit button
+            self._click_first_visible_in(driver, root, self.SUBMIT_SELECTORS)
+
+    def _wait_visible_in(
+        self,
+        driver: WebDriver,
+        root: Optional[WebElement],
+        selector_lists: Sequence[Sequence[str]],
+        timeout: int = 15,
+    ) -> Optional[List[WebElement]]:
+        """
+        Wait until every selector list has a visible match under `root`; returns
+        the matches in the same order, or None on timeout.
+        """
+        end = time.time() + timeout
+        lists = [list(sels) for sels in selector_lists]
+
+        # First lookup lets chromedriver block until something matches (polled
+        # server-side, one round-trip, all selectors fused into one group);
+        # visibility is then polled from here, in selector priority order.
+        with self._with_implicit_wait(driver, timeout):
+            if not self._find_all_in(driver, root, ", ".join(sel for sels in lists for sel in sels)):
+                return None
+
+        for delay in _backoff():
+            try:
+                els = driver.execute_script(self._JS_ALL_VISIBLE, root, lists)
+            except Exception:
+                els = None
+            if els:
+                return els
+            if time.time() >= end:
+                return None
+            time.sleep(delay)
+        return None  # unreachable: _backoff() never ends
+
+    @contextmanager
+    def _with_implicit_wait(self, driver: WebDriver, seconds: float) -> Iterator[None]:
+        prev = driver.timeouts.implicit_wait
+        driver.implicitly_wait(seconds)
+        try:
+            yield
+        finally:
+            driver.implicitly_wait(prev)
+
+    def _find_all_in(self, driver: WebDriver, root: Optional[WebElement], css: str) -> List[WebElement]:
+        try:
+            return (root or driver).find_elements(By.CSS_SELECTOR, css)
+        except Exception:
+            return []
+
+    def _click_first_visible_in(self, driver: WebDriver, root: Optional[WebElement], selectors: Sequence[str]) -> bool:
+        try:
+            return bool(driver.execute_script(self._JS_CLICK_FIRST_VISIBLE, root, list(selectors)))
+        except Exception:
+            return False
+
+    def _clear_and_type(self, driver: WebDriver, el: WebElement, text: str) -> None:
+        # Assigning the value overwrites it, so this path needs no clearing
+        if self._fast_fill(driver, el, text):
+            return
+
+        try:
+            el.clear()
+        except Exception:
+            pass
+        try:
+            el.send_keys(Keys.CONTROL, "a")
+            el.send_keys(Keys.BACKSPACE)
+        except Exception:
+            pass
+        # Chromium: insert the whole string as one input (a single CDP command)
+        # rather than synthesising key events per character.
+        try:
+            driver.execute_script("arguments[0].focus();", el)
+            driver.execute_cdp_cmd("Input.insertText", {"text": text})
+            return
+        except Exception:
+            pass
+        el.send_keys(text)
+
+    def _fast_fill(self, driver: WebDriver, el: WebElement, text: str) -> bool:
+        # One round-trip; reports False if the page rewrote the value (e.g. it only
+        # accepts input through key events), so the caller types it instead.
+        try:
+            return bool(driver.execute_script(self._JS_FILL, el, text))
+        except Exception:
+            return False
+
+    def _dbg(self, msg: str, driver: WebDriver, debug: bool) -> str:
+        if not debug:
+            return msg
+        try:
+            return f"{msg}. url={driver.current_url!r} title={driver.title!r}"
+        except Exception:
+            return msg
@@ -1,17 +1,17 @@
-import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 
-from .base import BaseLoginProvider
+from .base import FormLoginProvider
 
 
-class SmergersLogin(BaseLoginProvider):
+class SmergersLogin(FormLoginProvider):
+    __slots__ = ()
+
     site_key = "smergers"
     LOGIN_URL = "https://www.smergers.com/login/"
 
@@ -19,174 +19,168 @@ class SmergersLogin(BaseLoginProvider):
     # This avoids picking up header search inputs etc.
     TAB_LABELS = ("SOCIAL", "REGISTER", "LOGIN")
 
-    def login(self, driver: WebDriver, username: str, password: str, **kwargs: Any) -> List[Dict[str, Any]]:
-        debug = bool(kwargs.get("debug", False))
-
-        driver.get(self.LOGIN_URL)
-
+    # XPath derived from TAB_LABELS, built once at import rather than per login:
+    # from the first SOCIAL label, the nearest ancestor that also holds the other
+    # labels (the same climb as walking up parents one by one).
+    LOGIN_BOX_XPATH = "(//*[normalize-space()='{}'])[1]/ancestor::*[{}][1]".format(
+        TAB_LABELS[0],
+        " and ".join(f".//*[normalize-space()='{label}']" for label in TAB_LABELS[1:]),
+    )
+    TAB_CANDIDATES_CSS = "a, button, div, li"
+
+    # Find the tab whose text is exactly arguments[1] inside arguments[0] (so
+    # "Login with Google" never matches), all in-page: one scan instead of a
+    # .text read per candidate. Visible text first; then whitespace-normalised
+    # textContent on any element, like the old normalize-space() XPath fallback.
+    _JS_FIND_TAB = """
+        const [box, label, candidates] = arguments;
+        const visible = """ + FormLoginProvider._JS_IS_VISIBLE + """;
+        const pick = (sel, text) => {
+            for (const e of box.querySelectorAll(sel)) {
+                if (text(e) === label && visible(e)) return e;
+            }
+            return null;
+        };
+        return pick(candidates, (e) => (e.innerText || '').trim())
+            || pick('*', (e) => (e.textContent || '').replace(/\\s+/g, ' ').trim());
+    """
+
+    TAB_SWITCH_TIMEOUT = 5  # seconds to wait for the login panel after the tab click
+
+    # Async: click the tab, then report back as soon as the LOGIN panel is in -
+    # watched in-page via MutationObserver plus a short interval (class-free
+    # reveals like :checked don't mutate the DOM) - or after arguments[4] ms. One
+    # round-trip replacing click + fixed sleep + polling.
+    # REGISTER shows a password input too, so "a password is visible" only counts
+    # if none was visible before the click or the tab was already active;
+    # otherwise the set of visible password inputs has to change (REGISTER's
+    # hidden, or LOGIN's shown).
+    _JS_CLICK_TAB_AND_AWAIT = """
+        const [box, label, candidates, passwordSelectors, timeoutMs, done] = arguments;
+        const findTab = function () {""" + _JS_FIND_TAB + """};
+        const visible = """ + FormLoginProvider._JS_IS_VISIBLE + """;
+        const scrollIntoView = """ + FormLoginProvider._JS_SCROLL_INTO_VIEW + """;
+        const passwords = (root) =>
+            Array.from(root.querySelectorAll(passwordSelectors.join(', '))).filter(visible);
+        const isActive = (e) => [e, e.parentElement].some((n) => n && (
+            n.getAttribute('aria-selected') === 'true' || n.classList.contains('active')));
+
+        const tab = findTab(box, label, candidates);
+        if (!tab) { done(false); return; }
+        const before = passwords(box);
+        const settled = before.length === 0 || isActive(tab);
+        scrollIntoView(tab);
+        tab.click();
+
+        const ready = () => {
+            const now = passwords(box.isConnected ? box : document);
+            if (now.length === 0) return false;
+            return settled
+                || before.some((e) => !now.includes(e))
+                || now.some((e) => !before.includes(e));
+        };
+        if (ready()) { done(true); return; }
+        let finished = false;
+        let timer = null;
+        let interval = null;
+        const observer = new MutationObserver(() => { if (ready()) finish(); });
+        function finish() {
+            if (finished) return;
+            finished = true;
+            observer.disconnect();
+            clearTimeout(timer);
+            clearInterval(interval);
+            done(true);
+        }
+        timer = setTimeout(finish, timeoutMs);
+        interval = setInterval(() => { if (ready()) finish(); }, 50);
+        observer.observe(document.body, {subtree: true, childList: true, attributes: true});
+    """
+
+    def _pre_form_hook(self, driver: WebDriver, debug: bool) -> Optional[WebElement]:
         # Wait for page to have the tab bar somewhere
-        WebDriverWait(driver, 25).until(lambda d: self._find_login_box(d) is not None)
-
-        self._fail_if_google(driver)
-
-        box = self._find_login_box(driver)
-        if box is None:
-            raise RuntimeError(self._dbg("SMERGERS: could not locate login box", driver, debug))
+        # (finding the SOCIAL/REGISTER/LOGIN tabs already proves we're not on Google)
+        # until() hands back the box found on the successful poll; no second lookup
+        box = WebDriverWait(driver, 25, poll_frequency=self.POLL_INTERVAL).until(self._find_login_box)
 
-        # Click LOGIN tab INSIDE the box
+        # Always click LOGIN tab INSIDE the box: REGISTER has a password input too,
+        # so a visible one doesn't prove the login form is showing. Clicking the
+        # already-active tab is harmless.
         if not self._click_login_tab_in_box(driver, box):
             raise RuntimeError(self._dbg("SMERGERS: could not click LOGIN tab", driver, debug))
+        # The tab switch may re-render the card
+        box = self._live_box(driver, box)
+        if box is None:
+            raise RuntimeError(self._dbg("SMERGERS: login box disappeared after LOGIN tab click", driver, debug))
 
-        # Wait until password is visible inside the box
-        email_el = self._wait_visible_in(box, [
-            "input[type='email']",
-            "input[name='email']",
-            "input[id*='email' i]",
-            "input[placeholder*='email' i]",
-        ], timeout=20)
-
-        pass_el = self._wait_visible_in(box, [
-            "input[type='password']",
-            "input[name='password']",
-            "input[id*='password' i]",
-        ], timeout=20)
-
-        if email_el is None or pass_el is None:
-            raise RuntimeError(self._dbg("SMERGERS: login inputs not found inside login box", driver, debug))
-
-        # Fill fields
-        self._clear_and_type(email_el, username)
-        self._clear_and_type(pass_el, password)
-
-        # Submit (prefer Enter on password)
-        try:
-            pass_el.send_keys(Keys.ENTER)
-        except Exception:
-            # fallback: find a submit button inside box
-            btn = self._first_visible_in(box, [
-                "button[type='submit']",
-                "input[type='submit']",
-                "button",
-            ])
-            if btn:
-                btn.click()
-
-        # Wait a bit for cookies/session to set; also detect OAuth bounce
-        def done(d: WebDriver) -> bool:
-            self._fail_if_google(d)
-            url = (d.current_url or "").lower()
-            return ("/login" not in url) and ("smergers.com" in url)
+        # Inputs are searched inside the box only (avoids header search inputs etc.)
+        return box
 
-        try:
-            WebDriverWait(driver, 30).until(done)
-        except Exception:
-            # Not fatal; sometimes it stays on /login but still sets cookies
-            pass
+    def _logged_in(self, page: Dict[str, Any]) -> bool:
+        # Also detect an OAuth bounce while waiting for the session
+        self._raise_if_google(page["url"], page["title"])
+        if "smergers.com" not in page["url"].lower():
+            return False
+        return super()._logged_in(page)
 
+    def _wait_logged_in(self, driver: WebDriver) -> bool:
+        if super()._wait_logged_in(driver):
+            return True
+        # On success _logged_in has just run the OAuth check, so only repeat it here.
         self._fail_if_google(driver)
-        return driver.get_cookies()
+        return False
 
     # -------- helpers --------
 
     def _find_login_box(self, driver: WebDriver) -> Optional[WebElement]:
-        # Strategy: find elements containing the 3 tab labels and pick the smallest common container.
-        # We do this by locating the "SOCIAL" text near "REGISTER" and "LOGIN".
-        # On current page, these are in the right-side card.
+        # Smallest common container of the 3 tab labels, resolved by the browser's
+        # XPath engine in one round-trip (see LOGIN_BOX_XPATH).
+        # On current page, this is the right-side card.
         try:
-            candidates = driver.find_elements(By.XPATH, "//*[normalize-space()='SOCIAL']")
+            els = driver.find_elements(By.XPATH, self.LOGIN_BOX_XPATH)
         except Exception:
             return None
+        return els[0] if els else None
 
-        for el in candidates:
-            try:
-                # Climb a few levels up and check if that container contains REGISTER and LOGIN too
-                container = el
-                for _ in range(6):
-                    parent = container.find_element(By.XPATH, "..")
-                    text = (parent.text or "")
-                    if all(lbl in text for lbl in self.TAB_LABELS):
-                        return parent
-                    container = parent
-            except Exception:
-                continue
-        return None
+    def _live_box(self, driver: WebDriver, box: WebElement) -> Optional[WebElement]:
+        # Keep using the box we already found; only look it up again if its node
+        # was replaced (one cheap command instead of a full _find_login_box).
+        try:
+            box.is_enabled()
+            return box
+        except StaleElementReferenceException:
+            return self._find_login_box(driver)
 
     def _click_login_tab_in_box(self, driver: WebDriver, box: WebElement) -> bool:
-        # Click element whose visible text is exactly LOGIN (avoid "Login with Google")
+        # Click element whose visible text is exactly LOGIN (avoid "Login with Google"),
+        # and return once the login form has switched in rather than after a fixed sleep.
+        prev = driver.timeouts.script
+        driver.set_script_timeout(self.TAB_SWITCH_TIMEOUT + 1)
         try:
-            els = box.find_elements(By.XPATH, ".//*[self::a or self::button or self::div or self::li]")
+            return bool(driver.execute_async_script(
+                self._JS_CLICK_TAB_AND_AWAIT,
+                box,
+                self.TAB_LABELS[2],
+                self.TAB_CANDIDATES_CSS,
+                list(self.PASSWORD_SELECTORS),
+                self.TAB_SWITCH_TIMEOUT * 1000,
+            ))
         except Exception:
             return False
+        finally:
+            driver.set_script_timeout(prev)
 
-        for el in els:
-            try:
-                txt = (el.text or "").strip()
-                if txt == "LOGIN" and el.is_displayed() and el.is_enabled():
-                    el.click()
-                    time.sleep(0.3)
-                    return True
-            except Exception:
-                continue
-
-        # Fallback: click by XPath exact match within box
-        try:
-            el = box.find_element(By.XPATH, ".//*[normalize-space()='LOGIN']")
-            if el.is_displayed() and el.is_enabled():
-                el.click()
-                time.sleep(0.3)
-                return True
-        except Exception:
-            pass
-
-        return False
-
-    def _wait_visible_in(self, root: WebElement, selectors: List[str], timeout: int = 15) -> Optional[WebElement]:
-        end = time.time() + timeout
-        while time.time() < end:
-            el = self._first_visible_in(root, selectors)
-            if el is not None:
-                return el
-            time.sleep(0.2)
-        return None
-
-    def _first_visible_in(self, root: WebElement, selectors: List[str]) -> Optional[WebElement]:
-        for sel in selectors:
-            try:
-                els = root.find_elements(By.CSS_SELECTOR, sel)
-            except Exception:
-                continue
-            for el in els:
-                try:
-                    if el.is_displayed() and el.is_enabled():
-                        return el
-                except Exception:
-                    continue
-        return None
-
-    def _clear_and_type(self, el: WebElement, text: str) -> None:
-        try:
-            el.clear()
-        except Exception:
-            pass
+    def _fail_if_google(self, driver: WebDriver) -> None:
+        # URL + title in one CDP command instead of two WebDriver round-trips
         try:
-            el.send_keys(Keys.CONTROL, "a")
-            el.send_keys(Keys.BACKSPACE)
+            info = driver.execute_cdp_cmd("Target.getTargetInfo", {})["targetInfo"]
+            url, title = info.get("url") or "", info.get("title") or ""
         except Exception:
-            pass
-        el.send_keys(text)
+            url, title = driver.current_url or "", driver.title or ""
+        self._raise_if_google(url, title)
 
-    def _fail_if_google(self, driver: WebDriver) -> None:
-        url = (driver.current_url or "").lower()
-        title = (driver.title or "").lower()
-        if "accounts.google.com" in url or "google accounts" in title:
+    def _raise_if_google(self, url: str, title: str) -> None:
+        if "accounts.google.com" in url.lower() or "google accounts" in title.lower():
             raise RuntimeError(
-                f"SMERGERS: redirected to Google OAuth unexpectedly. url={driver.current_url!r} title={driver.title!r}"
+                f"SMERGERS: redirected to Google OAuth unexpectedly. url={url!r} title={title!r}"
             )
-
-    def _dbg(self, msg: str, driver: WebDriver, debug: bool) -> str:
-        if not debug:
-            return msg
-        try:
-            return f"{msg}. url={driver.current_url!r} title={driver.title!r}"
-        except Exception:
-            return msg
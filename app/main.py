@@ -1,22 +1,80 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import Dict, Any, List
+from pydantic import BaseModel, ConfigDict
+from typing import Dict, Any, List, Tuple
+import asyncio
+import importlib
+import inspect
+import os
+import pkgutil
+from urllib.parse import urlsplit
 
-from .selenium_client import create_driver, cookies_to_header
-from .logins.flippa import FlippaLogin
-from .logins.smergers import SmergersLogin
+from . import logins
+from .selenium_client import DriverPool, DriverPoolUnavailable, cookies_to_header
+from .logins.base import BaseLoginProvider
 
 
-app = FastAPI(title="Selenium Login Service")
+def discover_providers() -> Dict[str, BaseLoginProvider]:
+    """
+    Instantiate every concrete provider defined in a module of app.logins, keyed
+    by site_key. Runs once at import; adding a site needs no change here.
+    """
+    providers: Dict[str, BaseLoginProvider] = {}
+    for info in pkgutil.iter_modules(logins.__path__):
+        module = importlib.import_module(f"{logins.__name__}.{info.name}")
+        for obj in vars(module).values():
+            if (
+                inspect.isclass(obj)
+                and issubclass(obj, BaseLoginProvider)
+                and obj.__module__ == module.__name__  # skip re-imported bases
+                and not inspect.isabstract(obj)
+                and getattr(obj, "site_key", None)
+            ):
+                providers[obj.site_key] = obj()
+    return providers
 
-# Register all login providers here
-LOGIN_PROVIDERS = {
-    FlippaLogin.site_key: FlippaLogin(),
-    SmergersLogin.site_key: SmergersLogin(),
-}
+
+def login_origins(providers: Dict[str, BaseLoginProvider]) -> List[str]:
+    """Origins of the providers' login pages, e.g. "https://flippa.com"."""
+    origins: List[str] = []
+    for provider in providers.values():
+        url = getattr(provider, "LOGIN_URL", None)
+        if url:
+            parts = urlsplit(url)
+            origin = f"{parts.scheme}://{parts.netloc}"
+            if origin not in origins:
+                origins.append(origin)
+    return origins
+
+
+LOGIN_PROVIDERS = discover_providers()
+
+
+# Warm browsers shared by all requests; at most this many logins run at once.
+# Pooled browsers serve different users in turn, so every provider origin's
+# storage is wiped between logins.
+driver_pool = DriverPool(
+    size=int(os.environ.get("DRIVER_POOL_SIZE", "2")),
+    origins=login_origins(LOGIN_PROVIDERS),
+    checkout_timeout=float(os.environ.get("DRIVER_CHECKOUT_TIMEOUT", "60")),
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    driver_pool.start()
+    try:
+        yield
+    finally:
+        driver_pool.close()
+
+
+app = FastAPI(title="Selenium Login Service", lifespan=lifespan)
 
 
 class LoginRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     site: str
     username: str
     password: str
@@ -24,24 +82,34 @@ class LoginRequest(BaseModel):
 
 
 class LoginResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     site: str
     cookie_header: str
     cookies: List[Dict[str, Any]]
 
 
+def _do_login(provider: BaseLoginProvider, req: LoginRequest) -> Tuple[List[Dict[str, Any]], str]:
+    # Blocking: waits for a pooled driver, then drives the whole Selenium flow
+    with driver_pool.driver() as driver:
+        cookies = provider.login(driver, req.username, req.password, **req.extra)
+        cookie_header = cookies_to_header(cookies)
+    return cookies, cookie_header
+
+
 @app.post("/login", response_model=LoginResponse)
-def login(req: LoginRequest):
+async def login(req: LoginRequest):
     if req.site not in LOGIN_PROVIDERS:
         raise HTTPException(status_code=400, detail=f"Unknown site '{req.site}'")
 
     provider = LOGIN_PROVIDERS[req.site]
 
-    driver = create_driver()
+    # Selenium work runs on a worker thread so the event loop stays free to
+    # accept other requests while logins wait on the browser.
     try:
-        cookies = provider.login(driver, req.username, req.password, **req.extra)
-        cookie_header = cookies_to_header(cookies)
-    finally:
-        driver.quit()
+        cookies, cookie_header = await asyncio.to_thread(_do_login, provider, req)
+    except DriverPoolUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
 
     return LoginResponse(
         site=req.site,
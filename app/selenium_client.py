@@ -1,29 +1,227 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from typing import List, Dict, Any
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Tuple
 import os
+import shutil
+import tempfile
+import threading
 
 
-def create_driver() -> webdriver.Chrome:
+# Third-party trackers on the login pages; nothing a provider waits on
+BLOCKED_URL_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*segment.io*",
+]
+
+
+def create_driver(profile_dir: Optional[str] = None) -> webdriver.Chrome:
+    """
+    Headless Chrome tuned for scripted logins. `profile_dir` is used as the
+    user-data dir; the caller owns it (DriverPool creates and removes one per slot).
+    """
     chrome_options = Options()
     chrome_options.add_argument("--headless=new")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--disable-features=Translate,BackForwardCache")
+    for flag in (
+        "--disable-extensions",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--disable-default-apps",
+        "--metrics-recording-only",
+        "--mute-audio",
+    ):
+        chrome_options.add_argument(flag)
+    if profile_dir:
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+    # A pooled profile lives as long as its slot and reset_driver never clears
+    # the HTTP cache, so cap it
+    chrome_options.add_argument("--disk-cache-size=52428800")  # 50 MB
+    # Providers only need the DOM; don't wait on (or fetch) images
+    chrome_options.page_load_strategy = "eager"
+    chrome_options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
 
     service = Service(executable_path=os.environ.get("CHROMEDRIVER_PATH", "/usr/bin/chromedriver"))
     driver = webdriver.Chrome(service=service, options=chrome_options)
     driver.set_page_load_timeout(60)
+    try:
+        # Set on the driver's CDP session, so it holds for every later login
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception:
+        pass
     return driver
 
 
+def reset_driver(driver: webdriver.Chrome, origins: Sequence[str] = ()) -> None:
+    """
+    Wipe session state left by a login so the browser can serve the next one.
+    `origins` (e.g. "https://flippa.com") get all their storage cleared, whichever
+    page the tab ended on. Raises if the session is unusable.
+    """
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    try:
+        driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+    except Exception:
+        pass
+    for origin in origins:
+        # localStorage, IndexedDB, Cache Storage, service workers, ...
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+    try:
+        # All domains, not just the current document's (unlike delete_all_cookies)
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    except Exception:
+        driver.delete_all_cookies()
+    driver.get("about:blank")
+
+
+# A pooled driver and the profile dir it was started with
+_Slot = Tuple[webdriver.Chrome, str]
+
+
+class DriverPoolUnavailable(RuntimeError):
+    """No driver could be checked out: the pool is closed, not started, or busy."""
+
+
+class DriverPool:
+    """
+    Fixed-size pool of warm Chrome drivers. Each login checks one out exclusively
+    and hands it back reset instead of quitting it, so Chrome's multi-second cold
+    start is paid once per slot rather than once per request.
+
+    Each slot's driver is kept together with its throwaway profile dir (in the
+    default temp dir, not on /dev/shm: that is tiny in containers, hence
+    --disable-dev-shm-usage), and both are removed together.
+    """
+
+    def __init__(self, size: int, origins: Sequence[str] = (), checkout_timeout: float = 60) -> None:
+        if size < 1:
+            raise ValueError(f"DriverPool size must be at least 1, got {size}")
+        self.size = size
+        self.origins = tuple(origins)  # storage wiped between logins, see reset_driver
+        self.checkout_timeout = checkout_timeout  # seconds to wait for a free slot
+        # None = empty slot; a driver is created for it on checkout
+        self._idle: List[Optional[_Slot]] = []
+        # Guards _idle/_started/_closed; notified when a slot comes back or on close()
+        self._cond = threading.Condition()
+        self._started = False
+        self._closed = False
+
+    def start(self) -> None:
+        slots: List[Optional[_Slot]] = []
+        for _ in range(self.size):
+            try:
+                slots.append(self._new_slot())
+            except Exception:
+                slots.append(None)
+        with self._cond:
+            self._idle.extend(slots)
+            self._started = True
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        # Wakes any waiting checkout (it fails); drivers still checked out are
+        # discarded when they come back (see _release)
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for slot in idle:
+            if slot is not None:
+                self._discard(slot)
+
+    @contextmanager
+    def driver(self) -> Iterator[webdriver.Chrome]:
+        """
+        Check out a driver for the duration of the block, waiting up to
+        checkout_timeout if all are busy. Raises DriverPoolUnavailable otherwise.
+        """
+        slot = self._checkout()
+        if slot is None:
+            try:
+                slot = self._new_slot()
+            except Exception:
+                self._release(None)
+                raise
+        try:
+            yield slot[0]
+        finally:
+            self._release(self._recycle(slot))
+
+    def _new_slot(self) -> _Slot:
+        profile_dir = tempfile.mkdtemp(prefix="chrome-")
+        try:
+            return create_driver(profile_dir), profile_dir
+        except Exception:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            raise
+
+    def _discard(self, slot: _Slot) -> None:
+        driver, profile_dir = slot
+        _quit_quietly(driver)
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+    def _checkout(self) -> Optional[_Slot]:
+        with self._cond:
+            if not self._started:
+                raise DriverPoolUnavailable("driver pool has not been started")
+            ready = self._cond.wait_for(lambda: self._closed or self._idle, timeout=self.checkout_timeout)
+            if self._closed:
+                raise DriverPoolUnavailable("driver pool is closed")
+            if not ready:
+                raise DriverPoolUnavailable(f"no browser free after {self.checkout_timeout:g}s")
+            return self._idle.pop()
+
+    def _release(self, slot: Optional[_Slot]) -> None:
+        with self._cond:
+            if not self._closed:
+                self._idle.append(slot)
+                self._cond.notify()
+                return
+        if slot is not None:
+            self._discard(slot)
+
+    def _recycle(self, slot: _Slot) -> Optional[_Slot]:
+        with self._cond:
+            if self._closed:
+                return slot  # about to be discarded by _release; no point resetting it
+        try:
+            reset_driver(slot[0], self.origins)
+            return slot
+        except Exception:
+            # Broken session (crashed tab, dead chromedriver): drop it and let the
+            # next checkout start a fresh one.
+            self._discard(slot)
+            return None
+
+
+def _quit_quietly(driver: webdriver.Chrome) -> None:
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
 def cookies_to_header(cookies: List[Dict[str, Any]]) -> str:
-    parts = []
-    for c in cookies:
-        name = c.get("name")
-        value = c.get("value")
-        if name is not None and value is not None:
-            parts.append(f"{name}={value}")
-    return "; ".join(parts)
+    return "; ".join(
+        f"{name}={value}"
+        for c in cookies
+        if (name := c.get("name")) is not None and (value := c.get("value")) is not None
+    )
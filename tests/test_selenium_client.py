@@ -0,0 +1,148 @@
+import os
+import threading
+import time
+
+import pytest
+
+from app import selenium_client
+from app.selenium_client import DriverPool, DriverPoolUnavailable
+
+
+class StubDriver:
+    def __init__(self, profile_dir) -> None:
+        self.profile_dir = profile_dir
+        self.quit_calls = 0
+        self.resets = 0
+
+    def quit(self) -> None:
+        self.quit_calls += 1
+
+
+@pytest.fixture
+def drivers(monkeypatch):
+    """Every StubDriver the pool creates; reset_driver just counts calls."""
+    created = []
+
+    def create_driver(profile_dir=None):
+        driver = StubDriver(profile_dir)
+        created.append(driver)
+        return driver
+
+    def reset_driver(driver, origins=()):
+        driver.resets += 1
+
+    monkeypatch.setattr(selenium_client, "create_driver", create_driver)
+    monkeypatch.setattr(selenium_client, "reset_driver", reset_driver)
+    return created
+
+
+def test_rejects_empty_pool():
+    with pytest.raises(ValueError):
+        DriverPool(size=0)
+
+
+def test_checkout_before_start_fails_fast(drivers):
+    pool = DriverPool(size=1, checkout_timeout=5)
+    started = time.monotonic()
+    with pytest.raises(DriverPoolUnavailable):
+        with pool.driver():
+            pass
+    assert time.monotonic() - started < 1
+
+
+def test_driver_is_reset_and_reused(drivers):
+    pool = DriverPool(size=1)
+    pool.start()
+    with pool.driver() as first:
+        pass
+    with pool.driver() as second:
+        pass
+    assert first is second
+    assert os.path.isdir(first.profile_dir)
+    assert first.resets == 2
+    assert first.quit_calls == 0
+
+
+def test_broken_driver_is_replaced(drivers, monkeypatch):
+    pool = DriverPool(size=1)
+    pool.start()
+
+    def reset_driver(driver, origins=()):
+        raise RuntimeError("session gone")
+
+    monkeypatch.setattr(selenium_client, "reset_driver", reset_driver)
+    with pool.driver() as broken:
+        pass
+    assert broken.quit_calls == 1
+    assert not os.path.exists(broken.profile_dir)
+
+    with pool.driver() as fresh:
+        pass
+    assert fresh is not broken
+    assert len(drivers) == 2
+
+
+def test_checkout_times_out_when_busy(drivers):
+    pool = DriverPool(size=1, checkout_timeout=0.05)
+    pool.start()
+    with pool.driver():
+        with pytest.raises(DriverPoolUnavailable):
+            with pool.driver():
+                pass
+
+
+def test_close_quits_idle_drivers(drivers):
+    pool = DriverPool(size=2)
+    pool.start()
+    pool.close()
+    assert [d.quit_calls for d in drivers] == [1, 1]
+    assert not any(os.path.exists(d.profile_dir) for d in drivers)
+
+
+def test_driver_returned_after_close_is_quit(drivers):
+    pool = DriverPool(size=1)
+    pool.start()
+    with pool.driver() as driver:
+        pool.close()
+    assert driver.quit_calls == 1
+    assert driver.resets == 0
+    assert not os.path.exists(driver.profile_dir)
+
+
+def test_close_wakes_waiting_checkout(drivers):
+    pool = DriverPool(size=1, checkout_timeout=10)
+    pool.start()
+    errors = []
+
+    def wait_for_driver():
+        try:
+            with pool.driver():
+                pass
+        except DriverPoolUnavailable as e:
+            errors.append(e)
+
+    with pool.driver():
+        waiter = threading.Thread(target=wait_for_driver)
+        waiter.start()
+        time.sleep(0.05)
+        pool.close()
+        waiter.join(timeout=1)
+    assert not waiter.is_alive()
+    assert len(errors) == 1
+
+
+def test_profile_dir_removed_when_chrome_fails_to_start(monkeypatch):
+    dirs = []
+
+    def create_driver(profile_dir=None):
+        dirs.append(profile_dir)
+        raise RuntimeError("chromedriver missing")
+
+    monkeypatch.setattr(selenium_client, "create_driver", create_driver)
+    pool = DriverPool(size=1)
+    pool.start()
+    with pytest.raises(RuntimeError, match="chromedriver missing"):
+        with pool.driver():
+            pass
+    assert len(dirs) == 2
+    assert not any(os.path.exists(d) for d in dirs)